@@ -0,0 +1,262 @@
+from functools import lru_cache
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.special import chdtrc, fdtrc, kolmogorov, ndtr, stdtr
+
+from src.base import Prepared
+
+
+# SciPy uses the exact distribution of the U statistic when a sample has at most this many observations
+MWU_EXACT_MAX_SIZE = 8
+
+
+def mwu_pvalue(u_x: ArrayLike, nx: int, ny: int, tie_term: ArrayLike) -> ArrayLike:
+    """
+    Two-sided p-value of the Mann Whitney U statistic, from its normal approximation with tie and continuity
+    corrections. Works on scalars as well as on arrays of statistics, one per pair of samples.
+
+    Parameters
+    ----------
+    u_x (ArrayLike): The U statistic of the first sample.
+    nx (int): The size of the first sample.
+    ny (int): The size of the second sample.
+    tie_term (ArrayLike): The sum of t^3 - t over the runs of ties of the merged samples, t being their length.
+
+    Returns
+    -------
+    The two-sided p-value.
+    """
+    n = nx + ny
+    u = np.maximum(u_x, nx * ny - u_x)
+    sigma = np.sqrt(nx * ny / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    # all values tied: sigma is 0 and the p-value is 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (u - nx * ny / 2 - 0.5) / sigma
+    return np.minimum(2 * ndtr(-z), 1.0)
+
+
+def mann_whitney_u(prepared: Prepared) -> tuple:
+    """
+    Two-sided Mann Whitney U test computed from the rank-sum of the first sample.
+    Ranks are read from the order of the merged samples, tied values sharing their average rank, and the p-value is
+    given by mwu_pvalue. SciPy is only called for small samples, where it uses the exact distribution of the statistic
+    instead, and for samples holding NaN, so that it is propagated.
+
+    Parameters
+    ----------
+    prepared (Prepared): The two samples to be tested.
+
+    Returns
+    -------
+    The U statistic of the first sample and the two-sided p-value.
+    """
+    nx, ny = prepared.nx, prepared.ny
+    if min(nx, ny) <= MWU_EXACT_MAX_SIZE or prepared.has_nan:
+        from scipy.stats import mannwhitneyu
+
+        return tuple(mannwhitneyu(prepared.x, prepared.y, use_continuity=True))
+
+    n = nx + ny
+    merged_sorted = prepared.merged_sorted
+    run_starts = np.flatnonzero(
+        np.append(True, merged_sorted[1:] != merged_sorted[:-1])
+    )
+    if len(run_starts) == n:
+        rank_sum_x = np.flatnonzero(prepared.merged_order < nx).sum() + nx
+        tie_term = 0
+    else:
+        run_ends = np.append(run_starts[1:], n)
+        run_lengths = run_ends - run_starts
+        ranks = np.repeat((run_starts + run_ends + 1) / 2, run_lengths)
+        rank_sum_x = ranks[prepared.merged_order < nx].sum()
+        tie_term = (run_lengths**3 - run_lengths).sum()
+
+    u_x = rank_sum_x - nx * (nx + 1) / 2
+    return float(u_x), float(mwu_pvalue(u_x, nx, ny, tie_term))
+
+
+def ks_statistic(prepared: Prepared) -> float:
+    """
+    Supremum distance between the empirical CDFs of the two samples, evaluated at every observation.
+    Walking the merged samples, the scaled ECDF difference moves by +ny for an observation of x and by -nx for one of
+    y: it is a cumulative sum, computed without any comparison between the samples. Only the last position of each run
+    of tied values is kept. The distance stays on integers so that it is exactly comparable to the critical values.
+    It is NaN when a sample holds NaN.
+
+    Parameters
+    ----------
+    prepared (Prepared): The two samples to be tested.
+
+    Returns
+    -------
+    The D statistic.
+    """
+    if prepared.has_nan:
+        return np.nan
+    nx, ny = prepared.nx, prepared.ny
+    steps = np.where(prepared.merged_order < nx, ny, -nx)
+    differences = np.cumsum(steps)
+    merged_sorted = prepared.merged_sorted
+    # compared rather than subtracted: runs of equal infinite values would give NaN differences
+    run_ends = np.append(merged_sorted[1:] != merged_sorted[:-1], True)
+    return np.abs(differences[run_ends]).max() / (nx * ny)
+
+
+def kolmogorov_smirnov(prepared: Prepared) -> tuple:
+    """
+    Two-sided two samples Kolmogorov-Smirnov test. For samples of equal sizes from 100 observations, the p-value uses
+    the asymptotic Kolmogorov distribution, which stays within a few thousandths of SciPy's p-value at these sizes.
+    In the other cases SciPy is called: its exact distribution for unequal sizes and its kstwo approximation beyond
+    10000 observations differ noticeably from the asymptotic one.
+
+    Parameters
+    ----------
+    prepared (Prepared): The two samples to be tested.
+
+    Returns
+    -------
+    The D statistic and the two-sided p-value.
+    """
+    nx, ny = prepared.nx, prepared.ny
+    if nx != ny or nx < 100 or prepared.has_nan:
+        from scipy.stats import kstest
+
+        return tuple(kstest(prepared.x, prepared.y))
+
+    d = ks_statistic(prepared)
+    return float(d), float(kolmogorov(np.sqrt(nx / 2) * d))
+
+
+def student_t(prepared: Prepared) -> tuple:
+    """
+    Two-sided Student's T test for two samples of equal variances, computed from the cached means and variances.
+    The p-value is read from the Student distribution function directly, without going through SciPy's tests API.
+
+    Parameters
+    ----------
+    prepared (Prepared): The two samples to be tested.
+
+    Returns
+    -------
+    The T statistic and the two-sided p-value.
+    """
+    nx, ny = prepared.nx, prepared.ny
+    df = nx + ny - 2
+    pooled_var = ((nx - 1) * prepared.var_x + (ny - 1) * prepared.var_y) / df
+    statistic = (prepared.mean_x - prepared.mean_y) / np.sqrt(
+        pooled_var * (1 / nx + 1 / ny)
+    )
+    return float(statistic), float(2 * stdtr(df, -np.abs(statistic)))
+
+
+def bartlett(prepared: Prepared) -> tuple:
+    """
+    Bartlett's test for two samples, a closed form of the sample sizes and variances:
+    the log of the pooled variance against the logs of the sample variances, scaled by Bartlett's correction factor.
+
+    Parameters
+    ----------
+    prepared (Prepared): The two samples to be tested.
+
+    Returns
+    -------
+    The chi-squared statistic and the p-value.
+    """
+    nx, ny = prepared.nx, prepared.ny
+    var_x, var_y = prepared.var_x, prepared.var_y
+    pooled_var = ((nx - 1) * var_x + (ny - 1) * var_y) / (nx + ny - 2)
+    correction = 1 + (1 / (nx - 1) + 1 / (ny - 1) - 1 / (nx + ny - 2)) / 3
+    statistic = (
+        (nx + ny - 2) * np.log(pooled_var)
+        - (nx - 1) * np.log(var_x)
+        - (ny - 1) * np.log(var_y)
+    ) / correction
+    return float(statistic), float(chdtrc(1, statistic))
+
+
+def levene_median(prepared: Prepared) -> tuple:
+    """
+    Levene's test centered on the medians (Brown-Forsythe), written for two samples:
+    a one-way ANOVA on the absolute deviations of each sample to its median.
+
+    Parameters
+    ----------
+    prepared (Prepared): The two samples to be tested.
+
+    Returns
+    -------
+    The W statistic and the p-value.
+    """
+    nx, ny = prepared.nx, prepared.ny
+    zx = _absolute_deviations(prepared.x, prepared.median_x)
+    zy = _absolute_deviations(prepared.y, prepared.median_y)
+    mean_zx, mean_zy = zx.mean(), zy.mean()
+    mean_z = (nx * mean_zx + ny * mean_zy) / (nx + ny)
+    between = nx * (mean_zx - mean_z) ** 2 + ny * (mean_zy - mean_z) ** 2
+    # the deviations are not needed anymore: center them in place for the within-groups sum of squares
+    zx -= mean_zx
+    zy -= mean_zy
+    within = zx @ zx + zy @ zy
+    w = (nx + ny - 2) * between / within
+    return float(w), float(fdtrc(1, nx + ny - 2, w))
+
+
+def _absolute_deviations(x: np.ndarray, center: float) -> np.ndarray:
+    """
+    Absolute deviations of a sample to a center, computed in a single buffer instead of one temporary per operation.
+
+    Parameters
+    ----------
+    x (np.ndarray): The sample.
+    center (float): The value the deviations are taken from.
+    """
+    deviations = np.subtract(x, center, dtype=np.result_type(x.dtype, np.float32))
+    return np.abs(deviations, out=deviations)
+
+
+@lru_cache(maxsize=64)
+def _shapiro_coefficients(n: int) -> np.ndarray:
+    """
+    Royston's coefficients of the Shapiro-Wilk statistic, they only depend on the sample size.
+    The returned array is shared between calls and must not be modified.
+
+    Parameters
+    ----------
+    n (int): The size of the sample.
+    """
+    from scipy.stats._ansari_swilk_statistics import swilk
+
+    coefficients = np.zeros(n // 2, dtype=np.float64)
+    swilk(np.linspace(-1, 1, n), coefficients, 0)
+    return coefficients
+
+
+def shapiro_wilk(x: ArrayLike) -> tuple:
+    """
+    Shapiro-Wilk test reusing the coefficients computed for previous samples of the same size,
+    so that only the statistic and its p-value are computed when the test is repeated (bootstrap, permutations).
+    SciPy is called for the sizes and samples it warns about, and for samples holding NaN, so that it is propagated.
+
+    Parameters
+    ----------
+    x (ArrayLike): The sample to be tested.
+
+    Returns
+    -------
+    The W statistic and the p-value.
+    """
+    from scipy.stats import shapiro
+    from scipy.stats._ansari_swilk_statistics import swilk
+
+    y = np.sort(np.ravel(x).astype(np.float64))
+    n = len(y)
+    # NaN is sorted to the end
+    if n < 3 or n > 5000 or np.isnan(y[-1]):
+        return tuple(shapiro(x))
+
+    y -= y[n // 2]
+    w, pw, ifault = swilk(y, _shapiro_coefficients(n), 1)
+    if ifault not in (0, 2):
+        return tuple(shapiro(x))
+    return w, pw
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
 from numpy._typing import ArrayLike
 
 
-@dataclass
+@dataclass(slots=True)
 class TestParams:
     """
     Dataclass used to store test results. Attributes are:
@@ -11,6 +14,8 @@ class TestParams:
     test_statistic (float)
     test_pval (float)
     test_h0 (str)
+    test_critical_value (float)
+    test_h0_rejected (bool)
     is_fitted (bool)
     """
 
@@ -18,14 +23,160 @@ class TestParams:
     test_statistic: float = None
     test_pval: float = None
     test_h0: str = None
+    test_critical_value: float = None
+    test_h0_rejected: bool = None
     is_fitted: bool = False
 
 
+@dataclass
+class Prepared:
+    """
+    Dataclass holding the two samples of a two samples test, along with the primitives shared by the tests
+    (sorted samples, order of the merged samples, means, variances). Primitives are computed on first access
+    and cached, so that several tests run on the same Prepared object only compute them once.
+    When presorted is True, both samples are trusted to be sorted in ascending order and are used as their sorted
+    versions.
+    """
+
+    x: ArrayLike
+    y: ArrayLike
+    presorted: bool = False
+
+    def __post_init__(self):
+        self.x = np.asarray(self.x)
+        self.y = np.asarray(self.y)
+
+    def astype(self, dtype: str) -> "Prepared":
+        """
+        Samples cast to the given dtype. Returns the object itself when no cast is needed, so that its cached
+        primitives are kept.
+
+        Parameters
+        ----------
+        dtype (str): The dtype of the samples.
+        """
+        if self.x.dtype == dtype and self.y.dtype == dtype:
+            return self
+        return Prepared(
+            np.ascontiguousarray(self.x, dtype=dtype),
+            np.ascontiguousarray(self.y, dtype=dtype),
+            presorted=self.presorted,
+        )
+
+    def narrowed(self, dtype: str) -> "Prepared":
+        """
+        Samples cast to the given dtype only when it is narrower than theirs, see narrowed_array. The object itself is
+        returned when no sample is cast, so that its cached primitives are kept.
+
+        Parameters
+        ----------
+        dtype (str): The widest dtype of the samples.
+        """
+        x, y = narrowed_array(self.x, dtype), narrowed_array(self.y, dtype)
+        if x is self.x and y is self.y:
+            return self
+        return Prepared(x, y, presorted=self.presorted)
+
+    @property
+    def nx(self) -> int:
+        return len(self.x)
+
+    @property
+    def ny(self) -> int:
+        return len(self.y)
+
+    @cached_property
+    def has_nan(self) -> bool:
+        """Wheither either sample holds a NaN, the rank based primitives are meaningless in that case."""
+        return bool(np.isnan(self.x).any() or np.isnan(self.y).any())
+
+    @cached_property
+    def x_sorted(self) -> np.ndarray:
+        return self.x if self.presorted else np.sort(self.x)
+
+    @cached_property
+    def y_sorted(self) -> np.ndarray:
+        return self.y if self.presorted else np.sort(self.y)
+
+    @cached_property
+    def merged_order(self) -> np.ndarray:
+        """
+        Indices sorting the concatenation of the sorted x and the sorted y, indices lower than nx belong to x.
+        The concatenation is made of two sorted runs, which the stable sort detects and merges in linear time.
+        """
+        return np.argsort(self._sorted_runs, kind="stable")
+
+    @cached_property
+    def merged_sorted(self) -> np.ndarray:
+        return self._sorted_runs[self.merged_order]
+
+    @property
+    def _sorted_runs(self) -> np.ndarray:
+        return np.concatenate([self.x_sorted, self.y_sorted])
+
+    @cached_property
+    def mean_x(self) -> float:
+        return self.x.mean()
+
+    @cached_property
+    def mean_y(self) -> float:
+        return self.y.mean()
+
+    @cached_property
+    def median_x(self) -> float:
+        return np.median(self.x)
+
+    @cached_property
+    def median_y(self) -> float:
+        return np.median(self.y)
+
+    @cached_property
+    def var_x(self) -> float:
+        return _centered_sum_of_squares(self.x, self.mean_x) / (self.nx - 1)
+
+    @cached_property
+    def var_y(self) -> float:
+        return _centered_sum_of_squares(self.y, self.mean_y) / (self.ny - 1)
+
+
+def _centered_sum_of_squares(x: np.ndarray, mean: float) -> float:
+    """
+    Sum of the squared deviations of a sample to its mean, as the dot product of the centered sample with itself.
+    The dot product is a single BLAS call instead of a squaring pass followed by a reduction, and centering first
+    keeps the precision that the expanded sum(x**2) - n*mean**2 form would lose.
+
+    Parameters
+    ----------
+    x (np.ndarray): The sample.
+    mean (float): The mean of the sample.
+    """
+    centered = x - mean
+    return centered @ centered
+
+
+def narrowed_array(x: ArrayLike, dtype: str) -> np.ndarray:
+    """
+    Array cast to the given dtype only when it is narrower than its own. Widening it would not change the order of its
+    values, which is all the rank based tests read, so the array itself is returned in that case.
+
+    Parameters
+    ----------
+    x (ArrayLike): The array to be cast.
+    dtype (str): The widest dtype of the array.
+    """
+    x = np.asarray(x)
+    if np.can_cast(x.dtype, dtype):
+        return x
+    return np.ascontiguousarray(x, dtype=dtype)
+
+
 class OneSampleTest(ABC):
     """
     Abstract class that define the interface for the one sample test (Shapiro-Wilk, Anderson-Darling, ...)
     """
 
+    __slots__ = ("params",)
+
     def __init__(self):
         self.params = TestParams()
 
@@ -74,6 +225,9 @@ class TwoSampleTest(ABC):
     """
     Abstract class that define the interface for the two samples tests (Student, Kruskall-Wallis, Levene, Kolmogorov-Smirnov, ...)
     """
+
+    __slots__ = ("params",)
+
     def __init__(self):
         self.params = TestParams()
 
@@ -98,7 +252,6 @@ class TwoSampleTest(ABC):
             self._plot_results(x, y)
         return self
 
-    @abstractmethod
     def _compute_test(self, x: ArrayLike, y: ArrayLike) -> None:
         """
         The method where the test will be run in.
@@ -108,6 +261,17 @@ class TwoSampleTest(ABC):
         x (ArrayLike): The first sample to be tested.
         y (ArrayLike): The second sample to be tested.
         """
+        self._compute_from_prepared(Prepared(x, y))
+
+    @abstractmethod
+    def _compute_from_prepared(self, prepared: Prepared) -> None:
+        """
+        The method where the test will be run in, from samples whose shared primitives might already be computed.
+
+        Parameters
+        ----------
+        prepared (Prepared): The two samples to be tested.
+        """
         pass
 
     @abstractmethod
@@ -0,0 +1,42 @@
+from numpy.typing import ArrayLike
+
+from src.base import Prepared, TwoSampleTest
+from src.two_samples_tests import (
+    StudentTest,
+    MannUWhitneyTest,
+    LeveneTest,
+    BartlettTest,
+    KolmogorovSmirnovTest,
+)
+
+
+def _two_sample_testers() -> list[TwoSampleTest]:
+    return [
+        StudentTest(),
+        MannUWhitneyTest(),
+        LeveneTest(),
+        BartlettTest(),
+        KolmogorovSmirnovTest(),
+    ]
+
+
+def run_all_two_sample(x: ArrayLike, y: ArrayLike) -> list[TwoSampleTest]:
+    """
+    Run every two samples test on the same pair of samples. The primitives the tests have in common (sorts,
+    means, variances, ...) are computed once and shared between them instead of being recomputed by each test.
+
+    Parameters
+    ----------
+    x (ArrayLike): The first sample to be tested.
+    y (ArrayLike): The second sample to be tested.
+
+    Returns
+    -------
+    The fitted test objects.
+    """
+    prepared = Prepared(x, y)
+    testers = _two_sample_testers()
+    for tester in testers:
+        tester._compute_from_prepared(prepared)
+    return testers
+
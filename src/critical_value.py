@@ -0,0 +1,54 @@
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+
+def _ks_exact_pval(m: int, n: int, h: int) -> float:
+    """
+    Exact probability for the two-sided two samples KS statistic to be greater or equal to h / lcm(m, n).
+    """
+    from scipy.stats._stats_py import _attempt_exact_2kssamp
+
+    g = gcd(m, n)
+    _, _, pval = _attempt_exact_2kssamp(m, n, g, h / (m // g * n), "two-sided")
+    return pval
+
+
+@lru_cache(maxsize=1024)
+def ks_critical(m: int, n: int, alpha: float = 0.05) -> float:
+    """
+    Critical value of the two-sided two samples Kolmogorov-Smirnov test, the null hypothesis is rejected at the alpha
+    level when the statistic is greater or equal to it. When the smaller sample has at most 80 observations, the
+    critical value is the smallest attainable statistic whose exact p-value is lower than alpha: the exact distribution
+    stays cheap to compute then, whatever the size of the other sample, and the asymptotic value is far off for
+    unbalanced sizes. Otherwise the asymptotic c(alpha) * sqrt((m + n) / (m * n)) is used, with
+    c(alpha) = sqrt(-ln(alpha / 2) / 2) (1.358 for alpha = 0.05).
+    When even the largest attainable statistic is not significant, the critical value is infinite so that the null
+    hypothesis is never rejected.
+
+    Parameters
+    ----------
+    m (int): The size of the first sample.
+    n (int): The size of the second sample.
+    alpha (float): The significance level. Defaults to 0.05.
+
+    Returns
+    -------
+    The critical value of the KS statistic.
+    """
+    if min(m, n) > 80:
+        return np.sqrt(-np.log(alpha / 2) / 2) * np.sqrt((m + n) / (m * n))
+
+    # the statistic can only take values h / lcm(m, n), the p-value decreases with h
+    lcm = m // gcd(m, n) * n
+    if _ks_exact_pval(m, n, lcm) > alpha:
+        return np.inf
+    low, high = 1, lcm
+    while low < high:
+        h = (low + high) // 2
+        if _ks_exact_pval(m, n, h) <= alpha:
+            high = h
+        else:
+            low = h + 1
+    return low / lcm
@@ -1,8 +1,7 @@
 from numpy._typing import ArrayLike
-from scipy.stats import shapiro, anderson
 
+from src._kernels import shapiro_wilk
 from src.base import OneSampleTest
-from src.plotter import plot_results_shapiro_test
 
 
 class ShapiroWilkTest(OneSampleTest):
@@ -10,6 +9,9 @@ class ShapiroWilkTest(OneSampleTest):
     Class associated to the Shapiro-Wilk's test, used to determine if a distribution is sampled from a gaussian.
     When the cardinality increase, the test might become irrelevant. For more details: https://en.wikipedia.org/wiki/Shapiro%E2%80%93Wilk_test.
     """
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.params.test_h0 = r"$X~N(.)$"
@@ -23,7 +25,7 @@ class ShapiroWilkTest(OneSampleTest):
         ----------
         x (ArrayLike): The sample to be tested.
         """
-        shapiro_results = shapiro(x)
+        shapiro_results = shapiro_wilk(x)
         self.params.test_statistic = shapiro_results[0]
         self.params.test_pval = shapiro_results[1]
         self.params.is_fitted = True
@@ -36,4 +38,6 @@ class ShapiroWilkTest(OneSampleTest):
        ----------
        x (ArrayLike): The sample to be tested.
       """
+        from src.plotter import plot_results_shapiro_test
+
         plot_results_shapiro_test(x, shapiro_results=self.params)
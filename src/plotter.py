@@ -1,24 +1,128 @@
+import warnings
+from functools import lru_cache
+
 import numpy as np
-import matplotlib.pyplot as plt
 from numpy.typing import ArrayLike
-from scipy.stats import t
-import mplcyberpunk as mpl
-import seaborn as sns
+from scipy.signal import fftconvolve
+from scipy.stats import norm, t
 
 from src.base import TestParams
 
-plt.style.use("cyberpunk")
 COLORS = ["dodgerblue", "lime"]
+_FIG, _AXS = None, None
+_T_GRID = np.linspace(-5, 5, 401)
 
 
 # tools
+@lru_cache(maxsize=None)
+def _lazy_mpl() -> tuple:
+    """
+    Import the plotting libraries and apply the cyberpunk style. Done on the first plot only,
+    so that running the tests without plotting does not pay for these imports.
+
+    Returns
+    -------
+    The matplotlib.pyplot, seaborn and mplcyberpunk modules.
+    """
+    import matplotlib.pyplot as plt
+    import mplcyberpunk as mpl
+    import seaborn as sns
+
+    plt.style.use("cyberpunk")
+    return plt, sns, mpl
+
+
+def _get_fig() -> tuple:
+    """
+    The figure shared by the plots. It is created on the first plot, or when the previous one has been closed,
+    and is otherwise cleared and reused, which saves the creation and styling of a new figure for each plot.
+
+    Returns
+    -------
+    The figure and its two axes.
+    """
+    global _FIG, _AXS
+    plt, _, _ = _lazy_mpl()
+    if _FIG is None or not plt.fignum_exists(_FIG.number):
+        _FIG, _AXS = plt.subplots(1, 2, figsize=(15, 6))
+    else:
+        for ax in _AXS:
+            ax.cla()
+    return _FIG, _AXS
+
+
+def _fft_kde(x: ArrayLike, grid_size: int = 256) -> tuple:
+    """
+    Gaussian KDE of the sample, with Scott's bandwidth as seaborn does. The sample is linearly binned on a regular grid
+    and the bins are convolved with the kernel through an FFT, instead of evaluating the kernel for every
+    (observation, grid point) pair. The grid extends 3 bandwidths beyond the extreme observations.
+
+    Parameters
+    ----------
+    x (ArrayLike): The sample to be estimated.
+    grid_size (int): The number of points of the grid. Defaults to 256.
+
+    Returns
+    -------
+    The grid and the density evaluated on it.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    bandwidth = np.std(x, ddof=1) * len(x) ** (-1 / 5)
+    if not bandwidth > 0:
+        warnings.warn("Dataset has 0 variance; skipping density estimate.", UserWarning)
+        return np.array([]), np.array([])
+    grid = np.linspace(x.min() - 3 * bandwidth, x.max() + 3 * bandwidth, grid_size)
+    step = grid[1] - grid[0]
+
+    position = (x - grid[0]) / step
+    left = np.floor(position).astype(int)
+    weight_right = position - left
+    bins = np.bincount(left, weights=1 - weight_right, minlength=grid_size)
+    bins += np.bincount(left + 1, weights=weight_right, minlength=grid_size + 1)[:-1]
+
+    offsets = np.arange(-(grid_size - 1), grid_size) * step
+    kernel = norm.pdf(offsets, scale=bandwidth)
+    density = fftconvolve(bins, kernel, mode="same") / len(x)
+    return grid, np.clip(density, 0, None)
+
+
+def _violin_stats(x: ArrayLike, kde: tuple) -> dict:
+    """
+    Statistics drawn by matplotlib's violin for a sample, the body being interpolated from an already computed KDE
+    on the range of the sample, instead of fitting a new one.
+
+    Parameters
+    ----------
+    x (ArrayLike): The sample to be drawn.
+    kde (tuple): The grid and the density of the KDE of the sample.
+
+    Returns
+    -------
+    The statistics of the violin.
+    """
+    coords = np.linspace(np.min(x), np.max(x), 100)
+    return {
+        "coords": coords,
+        "vals": np.interp(coords, *kde) if len(kde[0]) else np.zeros_like(coords),
+        "mean": np.mean(x),
+        "median": np.median(x),
+        "min": np.min(x),
+        "max": np.max(x),
+    }
+
+
 def __kde_plotter(x: ArrayLike, y: ArrayLike, ax, **kwargs) -> None:
+    _, _, mpl = _lazy_mpl()
     x_name = kwargs.get("x_name", "First sample")
     y_name = kwargs.get("y_name", "Second sample")
     mean_x = np.mean(x)
     mean_y = np.mean(y)
 
-    sns.kdeplot(x=x, label=f"KDE of {x_name}", ax=ax, color=COLORS[0])
+    kde_x = kwargs.get("kde_x") or _fft_kde(x)
+    kde_y = kwargs.get("kde_y") or _fft_kde(y)
+
+    if len(kde_x[0]):
+        ax.plot(*kde_x, label=f"KDE of {x_name}", color=COLORS[0])
     ax.axvline(
         mean_x,
         color=COLORS[0],
@@ -26,9 +130,10 @@ def __kde_plotter(x: ArrayLike, y: ArrayLike, ax, **kwargs) -> None:
         linestyle="--",
         label=f"{x_name} mean| " + r"$\mu=$" + f"{mean_x:.2f}",
     )
-    sns.kdeplot(x=y, label=f"KDE of {y_name}", ax=ax, color=COLORS[1])
+    if len(kde_y[0]):
+        ax.plot(*kde_y, label=f"KDE of {y_name}", color=COLORS[1])
     ax.axvline(
-        np.mean(y),
+        mean_y,
         color=COLORS[1],
         lw=1,
         linestyle="--",
@@ -46,8 +151,14 @@ def __violin_plotter(x: ArrayLike, y: ArrayLike, ax, **kwargs) -> None:
     x_name = kwargs.get("x_name", "First sample")
     y_name = kwargs.get("y_name", "Second sample")
 
-    violins = ax.violinplot(
-        [x, y], vert=True, showmeans=False, showmedians=True  # vertical box alignment
+    kde_x = kwargs.get("kde_x") or _fft_kde(x)
+    kde_y = kwargs.get("kde_y") or _fft_kde(y)
+
+    violins = ax.violin(
+        [_violin_stats(x, kde_x), _violin_stats(y, kde_y)],
+        vert=True,  # vertical box alignment
+        showmeans=False,
+        showmedians=True,
     )
     ax.set_xticks(
         [y + 1 for y in range(2)],
@@ -73,6 +184,7 @@ def __violin_plotter(x: ArrayLike, y: ArrayLike, ax, **kwargs) -> None:
 
 
 def __ecdf_plotter(x: ArrayLike, y: ArrayLike, ax, **kwargs) -> None:
+    _, sns, _ = _lazy_mpl()
     x_name = kwargs.get("x_name", "First sample")
     y_name = kwargs.get("y_name", "Second sample")
 
@@ -95,23 +207,22 @@ def __student_plotter(
         label="t-statistic",
     )
 
-    x_shade = np.linspace(student_result.test_statistic, 5, 100)
+    pdf = t.pdf(_T_GRID, df=len(x) + len(y) - 2)
+    left_mask = _T_GRID <= student_result.test_statistic
     ax.fill_between(
-        x=np.linspace(-5, student_result.test_statistic, 100),
+        x=_T_GRID[left_mask],
         y1=0,
-        y2=t.pdf(
-            np.linspace(-5, student_result.test_statistic, 100),
-            df=len(x) + len(y) - 1,
-        ),
+        y2=pdf[left_mask],
         color="dodgerblue",
         label="T-distribution",
         alpha=0.3,
     )
 
+    right_mask = _T_GRID >= student_result.test_statistic
     ax.fill_between(
-        x=x_shade,
+        x=_T_GRID[right_mask],
         y1=0,
-        y2=t.pdf(x_shade, df=len(x) + len(y) - 2),
+        y2=pdf[right_mask],
         color="orangered",
         alpha=0.3,
         label="p-value area",
@@ -138,7 +249,8 @@ def __add_suptitle(fig, results: TestParams):
 
 # Central tendancy analysis
 def plot_results_student_test(x: ArrayLike, y: ArrayLike, results: TestParams) -> None:
-    fig, axs = plt.subplots(1, 2, figsize=(15, 6))
+    plt, _, _ = _lazy_mpl()
+    fig, axs = _get_fig()
     __kde_plotter(x=x, y=y, ax=axs[0])
     __student_plotter(x=x, y=y, student_result=results, ax=axs[1])
     __add_suptitle(fig=fig, results=results)
@@ -146,16 +258,19 @@ def plot_results_student_test(x: ArrayLike, y: ArrayLike, results: TestParams) -
 
 
 def plot_results_standard_test(x: ArrayLike, y: ArrayLike, results: TestParams) -> None:
-    fig, axs = plt.subplots(1, 2, figsize=(15, 6))
-    __kde_plotter(x=x, y=y, ax=axs[0])
-    __violin_plotter(x=x, y=y, ax=axs[1])
+    plt, _, _ = _lazy_mpl()
+    fig, axs = _get_fig()
+    kde_x, kde_y = _fft_kde(x), _fft_kde(y)
+    __kde_plotter(x=x, y=y, ax=axs[0], kde_x=kde_x, kde_y=kde_y)
+    __violin_plotter(x=x, y=y, ax=axs[1], kde_x=kde_x, kde_y=kde_y)
     __add_suptitle(fig=fig, results=results)
     plt.show()
 
 
 # Distribution analysis
 def plot_results_ks_test(x: ArrayLike, y: ArrayLike, ks_results: TestParams) -> None:
-    fig, axs = plt.subplots(1, 2, figsize=(15, 6))
+    plt, _, _ = _lazy_mpl()
+    fig, axs = _get_fig()
     __kde_plotter(x, y, axs[0])
     __ecdf_plotter(x, y, axs[1])
     __add_suptitle(fig=fig, results=ks_results)
@@ -163,23 +278,49 @@ def plot_results_ks_test(x: ArrayLike, y: ArrayLike, ks_results: TestParams) ->
 
 
 def plot_results_shapiro_test(x: ArrayLike, shapiro_results: TestParams) -> None:
-    fig, axs = plt.subplots(1, 2, figsize=(15, 6))
+    plt, sns, mpl = _lazy_mpl()
+    fig, axs = _get_fig()
     x_name = "Sample"
     y_name = "Inferred Normal Distribution"
-    normal_sample = np.random.normal(loc=np.mean(x), scale=np.std(x), size=1000)
-    __kde_plotter(
-        x=x,
-        y=normal_sample,
-        ax=axs[0],
-        x_name=x_name,
-        y_name=y_name,
+    mean_x = np.mean(x)
+    std_x = np.std(x)
+    grid = np.linspace(np.min(x) - 3 * std_x, np.max(x) + 3 * std_x, 200)
+
+    kde_x = _fft_kde(x)
+    if len(kde_x[0]):
+        axs[0].plot(*kde_x, label=f"KDE of {x_name}", color=COLORS[0])
+    axs[0].plot(
+        grid,
+        norm.pdf(grid, loc=mean_x, scale=std_x),
+        color=COLORS[1],
+        label=f"PDF of {y_name}",
+    )
+    axs[0].axvline(
+        mean_x,
+        color=COLORS[0],
+        lw=1,
+        linestyle="--",
+        label=f"{x_name} mean| " + r"$\mu=$" + f"{mean_x:.2f}",
     )
-    __ecdf_plotter(
-        x=x,
-        y=normal_sample,
-        ax=axs[1],
-        x_name=x_name,
-        y_name=y_name,
+    axs[0].set_title(f"Kernel Density Estimations", fontweight="bold")
+    axs[0].set_xlabel("Data", fontweight="bold")
+    axs[0].set_ylabel("Density", fontweight="bold")
+    axs[0].legend(loc="upper right")
+    axs[0].grid(True)
+    mpl.add_gradient_fill(ax=axs[0], alpha_gradientglow=0.3)
+
+    sns.ecdfplot(x=x, label=f"Empirical CDF of {x_name}", ax=axs[1], color=COLORS[0])
+    axs[1].plot(
+        grid,
+        norm.cdf(grid, loc=mean_x, scale=std_x),
+        color=COLORS[1],
+        label=f"CDF of {y_name}",
     )
+    axs[1].set_title(f"Cumulative Distribution Functions", fontweight="bold")
+    axs[1].set_xlabel("Data", fontweight="bold")
+    axs[1].set_ylabel("Cumulative Probability", fontweight="bold")
+    axs[1].legend()
+    axs[1].grid(True)
+
     __add_suptitle(fig=fig, results=shapiro_results)
     plt.show()
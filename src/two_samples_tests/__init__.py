@@ -0,0 +1,35 @@
+"""
+Two samples tests. Each test lives in its own submodule, which is only imported when the test is first accessed,
+so that using one test does not import the dependencies of the others.
+"""
+
+from importlib import import_module
+
+__all__ = [
+    "StudentTest",
+    "MannUWhitneyTest",
+    "LeveneTest",
+    "BartlettTest",
+    "KolmogorovSmirnovTest",
+]
+
+_SUBMODULES = {
+    # Central Tendancy Test
+    "StudentTest": "_student",
+    "MannUWhitneyTest": "_mann_whitney",
+    # Dispersion tests
+    "LeveneTest": "_levene",
+    "BartlettTest": "_bartlett",
+    # Distribution tests
+    "KolmogorovSmirnovTest": "_kolmogorov_smirnov",
+}
+
+
+def __getattr__(name: str):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{_SUBMODULES[name]}"), name)
+
+
+def __dir__() -> list:
+    return __all__
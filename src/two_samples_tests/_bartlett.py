@@ -0,0 +1,44 @@
+from numpy.typing import ArrayLike
+
+from src._kernels import bartlett
+from src.base import Prepared, TwoSampleTest
+
+
+class BartlettTest(TwoSampleTest):
+    """
+    Class associated to the Bartlett's test, used to compare the variances of two distributions.
+    For more details: https://en.wikipedia.org/wiki/Bartlett%27s_test.
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__()
+        self.params.test_h0 = r"$\sigma^2_1 = \sigma^2_2$"
+        self.params.test_name = "Bartlett test"
+
+    def _compute_from_prepared(self, prepared: Prepared) -> None:
+        """
+        Run the Bartlett's test between the two samples.
+
+        Parameters
+        ----------
+        prepared (Prepared): The two samples to be tested.
+        """
+        bartlett_results = bartlett(prepared)
+        self.params.test_statistic = bartlett_results[0]
+        self.params.test_pval = bartlett_results[1]
+        self.params.is_fitted = True
+
+    def _plot_results(self, x: ArrayLike, y: ArrayLike) -> None:
+        """
+        The method that will plot the result of the Levene's test.
+
+        Parameters
+        ----------
+        x (ArrayLike): The first sample to be tested.
+        y (ArrayLike): The second sample to be tested.
+        """
+        from src.plotter import plot_results_standard_test
+
+        plot_results_standard_test(x=x, y=y, results=self.params)
@@ -0,0 +1,103 @@
+from numpy.typing import ArrayLike
+
+from src._kernels import kolmogorov_smirnov, ks_statistic
+from src.base import Prepared, TwoSampleTest
+from src.critical_value import ks_critical
+
+
+class KolmogorovSmirnovTest(TwoSampleTest):
+    """
+    Class associated to the Kolmogorov-Smirnov's test, used to compare two distributions (or the goodness of fit between one and another).
+    Samples need to be big enough for the test to be relevant. For more details: https://en.wikipedia.org/wiki/Kolmogorov%E2%80%93Smirnov_test.
+    """
+
+    __slots__ = ("precision",)
+
+    def __init__(self, precision: str = "float64"):
+        """
+        Parameters
+        ----------
+        precision (str): The widest dtype the samples are sorted in, wider samples being cast to it. "float32" halves
+        the memory moved by the sort and is precise enough for samples of distinct values. Defaults to "float64".
+        """
+        super().__init__()
+        self.precision = precision
+        self.params.test_name = "Kolmogorov Smirnov Test"
+        self.params.test_h0 = r"The two distributions are the same"
+
+    def fit(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        plot_results: bool = False,
+        decision_only: bool = False,
+        alpha: float = 0.05,
+        presorted: bool = False,
+    ) -> "KolmogorovSmirnovTest":
+        """
+        Based on the sklearn API, run the test.
+
+        Parameters
+        ----------
+        x (ArrayLike): The first sample to be tested.
+        y (ArrayLike): The second sample to be tested.
+        plot_results (bool): Wheither to plot the results of the test. Defaults to False.
+        decision_only (bool): Wheither to skip the p-value and only decide on the null hypothesis at the alpha level.
+        The critical value of the statistic is stored along with the decision, the null hypothesis being rejected when
+        the statistic reaches it. Defaults to False.
+        alpha (float): The significance level used when decision_only is True. Defaults to 0.05.
+        presorted (bool): Wheither both samples are already sorted in ascending order, so that they are not sorted
+        again. Defaults to False.
+
+        Returns
+        -------
+        The fitted object.
+        """
+        prepared = Prepared(x, y, presorted=presorted)
+        if not decision_only:
+            self._compute_from_prepared(prepared)
+            if plot_results:
+                self._plot_results(x, y)
+            return self
+        if plot_results:
+            raise ValueError(
+                "Results can not be plotted without the p-value, use decision_only=False."
+            )
+
+        prepared = prepared.narrowed(self.precision)
+        self.params.test_statistic = ks_statistic(prepared)
+        self.params.test_pval = None
+        self.params.test_critical_value = ks_critical(prepared.nx, prepared.ny, alpha)
+        self.params.test_h0_rejected = bool(
+            self.params.test_statistic >= self.params.test_critical_value
+        )
+        self.params.is_fitted = True
+        return self
+
+    def _compute_from_prepared(self, prepared: Prepared) -> None:
+        """
+        Run the Kolmogorov-Smirnov's test between the two samples.
+
+        Parameters
+        ----------
+        prepared (Prepared): The two samples to be tested.
+        """
+        ks_results = kolmogorov_smirnov(prepared.narrowed(self.precision))
+        self.params.test_statistic = ks_results[0]
+        self.params.test_pval = ks_results[1]
+        self.params.test_critical_value = None
+        self.params.test_h0_rejected = None
+        self.params.is_fitted = True
+
+    def _plot_results(self, x: ArrayLike, y: ArrayLike) -> None:
+        """
+        The method that will plot the result of the Kolmogorov-Smirnov's test.
+
+        Parameters
+        ----------
+        x (ArrayLike): The first sample to be tested.
+        y (ArrayLike): The second sample to be tested.
+        """
+        from src.plotter import plot_results_ks_test
+
+        plot_results_ks_test(x, y, self.params)
@@ -0,0 +1,44 @@
+from numpy.typing import ArrayLike
+
+from src._kernels import levene_median
+from src.base import Prepared, TwoSampleTest
+
+
+class LeveneTest(TwoSampleTest):
+    """
+    Class associated to the Levene's test, used to compare the variances of two distributions.
+    Less sensitive to the non-normality than Bartlett's test. For more details: https://en.wikipedia.org/wiki/Levene%27s_test.
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__()
+        self.params.test_h0 = r"$\sigma^2_1 = \sigma^2_2$"
+        self.params.test_name = "Levene Test"
+
+    def _compute_from_prepared(self, prepared: Prepared) -> None:
+        """
+        Run the Levene's test between the two samples.
+
+        Parameters
+        ----------
+        prepared (Prepared): The two samples to be tested.
+        """
+        levene_results = levene_median(prepared)
+        self.params.test_statistic = levene_results[0]
+        self.params.test_pval = levene_results[1]
+        self.params.is_fitted = True
+
+    def _plot_results(self, x: ArrayLike, y: ArrayLike) -> None:
+        """
+        The method that will plot the result of the Levene's test.
+
+        Parameters
+        ----------
+        x (ArrayLike): The first sample to be tested.
+        y (ArrayLike): The second sample to be tested.
+        """
+        from src.plotter import plot_results_standard_test
+
+        plot_results_standard_test(x=x, y=y, results=self.params)
@@ -0,0 +1,104 @@
+from numpy.typing import ArrayLike
+
+from src._kernels import mann_whitney_u
+from src._mwu_batch import mann_whitney_u_columns
+from src.base import Prepared, TwoSampleTest, narrowed_array
+
+
+class MannUWhitneyTest(TwoSampleTest):
+    """
+    Class associated to the Mann Wilcoxon Whitney's (or 2 samples Kruskall-Wallis) "U" test, used to compare the medians of two distributions.
+    Can be seen as a non-parametric version of the Student's T test. For more details: https://en.wikipedia.org/wiki/Mann%E2%80%93Whitney_U_test.
+    """
+
+    __slots__ = ("precision",)
+
+    def __init__(self, precision: str = "float64"):
+        """
+        Parameters
+        ----------
+        precision (str): The widest dtype the samples are sorted in, wider samples being cast to it. "float32" halves
+        the memory moved by the sort and is precise enough for samples of distinct values. Defaults to "float64".
+        """
+        super().__init__()
+        self.precision = precision
+        self.params.test_h0 = r"P(X > Y) = P(Y > X)"
+        self.params.test_name = "Mann Wilcoxon Whitney U Test"
+
+    def fit(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        plot_results: bool = False,
+        presorted: bool = False,
+    ) -> "MannUWhitneyTest":
+        """
+        Based on the sklearn API, run the test.
+
+        Parameters
+        ----------
+        x (ArrayLike): The first sample to be tested.
+        y (ArrayLike): The second sample to be tested.
+        plot_results (bool): Wheither to plot the results of the test. Defaults to False.
+        presorted (bool): Wheither both samples are already sorted in ascending order, so that they are not sorted
+        again. Defaults to False.
+
+        Returns
+        -------
+        The fitted object.
+        """
+        self._compute_from_prepared(Prepared(x, y, presorted=presorted))
+        if plot_results:
+            self._plot_results(x, y)
+        return self
+
+    def fit_batch(self, x: ArrayLike, y: ArrayLike) -> "MannUWhitneyTest":
+        """
+        Run the test between every pair of matching columns of two 2-D arrays at once,
+        the test statistics and p-values being stored as arrays with one value per column.
+
+        Parameters
+        ----------
+        x (ArrayLike): The first samples to be tested, one per column.
+        y (ArrayLike): The second samples to be tested, one per column.
+
+        Returns
+        -------
+        The fitted object.
+        """
+        x, y = narrowed_array(x, self.precision), narrowed_array(y, self.precision)
+        if x.ndim != 2 or y.ndim != 2 or x.shape[1] != y.shape[1]:
+            raise ValueError(
+                f"Expected 2-D arrays with the same number of columns, got shapes {x.shape} and {y.shape}."
+            )
+        muw_results = mann_whitney_u_columns(x, y)
+        self.params.test_statistic = muw_results[0]
+        self.params.test_pval = muw_results[1]
+        self.params.is_fitted = True
+        return self
+
+    def _compute_from_prepared(self, prepared: Prepared) -> None:
+        """
+        Run the MWW U test between the two samples.
+
+        Parameters
+        ----------
+        prepared (Prepared): The two samples to be tested.
+        """
+        muw_results = mann_whitney_u(prepared.narrowed(self.precision))
+        self.params.test_statistic = muw_results[0]
+        self.params.test_pval = muw_results[1]
+        self.params.is_fitted = True
+
+    def _plot_results(self, x: ArrayLike, y: ArrayLike) -> None:
+        """
+        The method that will plot the result of the MWW's test.
+
+        Parameters
+        ----------
+        x (ArrayLike): The first sample to be tested.
+        y (ArrayLike): The second sample to be tested.
+        """
+        from src.plotter import plot_results_standard_test
+
+        plot_results_standard_test(x=x, y=y, results=self.params)
@@ -0,0 +1,44 @@
+from numpy.typing import ArrayLike
+
+from src._kernels import student_t
+from src.base import Prepared, TwoSampleTest
+
+
+class StudentTest(TwoSampleTest):
+    """
+    Class associated to the Student's "T" test, used to compare the means of two distributions (assuming variances are equal).
+    For more details: https://en.wikipedia.org/wiki/Student%27s_t-test.
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__()
+        self.params.test_h0 = r"$\mu_0 = \mu_1$"
+        self.params.test_name = "Student test"
+
+    def _compute_from_prepared(self, prepared: Prepared) -> None:
+        """
+        Run the Student's T test between the two samples.
+
+        Parameters
+        ----------
+        prepared (Prepared): The two samples to be tested.
+        """
+        t_test_results = student_t(prepared)
+        self.params.test_statistic = t_test_results[0]
+        self.params.test_pval = t_test_results[1]
+        self.params.is_fitted = True
+
+    def _plot_results(self, x: ArrayLike, y: ArrayLike) -> None:
+        """
+        The method that will plot the result of the Student's test.
+
+        Parameters
+        ----------
+        x (ArrayLike): The first sample to be tested.
+        y (ArrayLike): The second sample to be tested.
+        """
+        from src.plotter import plot_results_student_test
+
+        plot_results_student_test(x=x, y=y, results=self.params)
@@ -9,3 +9,8 @@ def test_params_fields():
     assert all(
         var in fields_name for var in expected_fields
     ), "Dataclass is missing expected variables"
+
+
+def test_params_slots():
+    params = TestParams()
+    assert not hasattr(params, "__dict__"), "Dataclass should not have a __dict__"
@@ -0,0 +1,34 @@
+import numpy as np
+
+from src.batch import run_all_two_sample
+from src.two_samples_tests import (
+    StudentTest,
+    MannUWhitneyTest,
+    LeveneTest,
+    BartlettTest,
+    KolmogorovSmirnovTest,
+)
+
+
+def test_run_all_two_sample_matches_fit():
+    mock_1 = np.random.normal(loc=5, scale=10, size=100)
+    mock_2 = np.random.normal(loc=6, scale=12, size=100)
+    batch_res = run_all_two_sample(mock_1, mock_2)
+    expected_res = [
+        StudentTest().fit(mock_1, mock_2),
+        MannUWhitneyTest().fit(mock_1, mock_2),
+        LeveneTest().fit(mock_1, mock_2),
+        BartlettTest().fit(mock_1, mock_2),
+        KolmogorovSmirnovTest().fit(mock_1, mock_2),
+    ]
+
+    for batch_tester, expected_tester in zip(batch_res, expected_res):
+        assert batch_tester.params.is_fitted, f"{batch_tester} has not been fitted"
+        assert np.isclose(
+            expected_tester.params.test_statistic,
+            batch_tester.params.test_statistic,
+        ), "tests statistic does not match single test run"
+        assert np.isclose(
+            expected_tester.params.test_pval, batch_tester.params.test_pval
+        ), "tests pval does not match single test run"
+
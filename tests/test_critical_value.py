@@ -0,0 +1,35 @@
+import numpy as np
+
+from src.critical_value import _ks_exact_pval, ks_critical
+
+
+def test_ks_critical_exact_table():
+    # two-sided critical values of Massey's table for m = n
+    assert np.isclose(
+        ks_critical(10, 10), 7 / 10
+    ), "critical value does not match table"
+    assert np.isclose(
+        ks_critical(10, 10, alpha=0.01), 8 / 10
+    ), "critical value does not match table"
+    assert np.isclose(
+        ks_critical(20, 20), 9 / 20
+    ), "critical value does not match table"
+
+
+def test_ks_critical_asymptotic():
+    assert np.isclose(
+        ks_critical(1000, 500), 1.358 * np.sqrt(1500 / (1000 * 500)), atol=1e-4
+    ), "critical value does not match asymptotic approximation"
+
+
+def test_ks_critical_unattainable():
+    # fully separated samples of these sizes are not significant at the 0.05 level
+    for m, n in [(3, 3), (2, 4), (1, 5), (2, 2)]:
+        assert np.isinf(ks_critical(m, n)), "critical value should not be attainable"
+
+
+def test_ks_critical_unbalanced():
+    # the smaller sample is small enough for the exact distribution, whatever the size of the other one
+    h = round(ks_critical(81, 5) * 405)
+    assert _ks_exact_pval(81, 5, h) <= 0.05, "critical value is not significant"
+    assert _ks_exact_pval(81, 5, h - 1) > 0.05, "critical value is not the smallest"
@@ -49,3 +49,27 @@ def test_shapiro_test_does_not_pass():
     assert (
         shapiro_res.params.test_pval <= 0.05
     ), "tests conclusion does not match expectation"
+
+
+def test_shapiro_test_same_size_samples():
+    tester = ShapiroWilkTest()
+    for _ in range(3):
+        mock = np.random.uniform(low=0, high=10, size=100)
+        res_expected = shapiro(mock)
+        tester.fit(mock)
+
+        assert np.isclose(
+            res_expected[0], tester.params.test_statistic, atol=1e-8
+        ), "tests statistic does not match reference"
+        assert np.isclose(
+            res_expected[1], tester.params.test_pval, atol=1e-8
+        ), "tests pvalue does not match reference"
+
+
+def test_shapiro_test_nan():
+    mock = np.random.normal(loc=5, scale=10, size=100)
+    mock[5] = np.nan
+    shapiro_res = ShapiroWilkTest().fit(mock)
+
+    assert np.isnan(shapiro_res.params.test_statistic), "NaN is not propagated"
+    assert np.isnan(shapiro_res.params.test_pval), "NaN is not propagated"
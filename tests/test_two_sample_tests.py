@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 from scipy.stats import ttest_ind, mannwhitneyu, kstest, bartlett, levene
 import pytest
@@ -11,16 +13,25 @@ from src.two_samples_tests import (
 )
 from src.base import TestParams
 
+_RNG = np.random.default_rng(1)
+_NORMAL_POOL = _RNG.standard_normal((15, 2, 1000), dtype=np.float32)
+_UNIFORM_POOL = _RNG.random(1000, dtype=np.float32)
+
+
+def _close(a: float, b: float, atol: float) -> bool:
+    return abs(float(a) - float(b)) <= atol
+
 
-@pytest.fixture
+_STUDENT = StudentTest()
+_MUW = MannUWhitneyTest()
+_LEVENE = LeveneTest()
+_BARTLETT = BartlettTest()
+_KS = KolmogorovSmirnovTest()
+
+
+@pytest.fixture(scope="module")
 def test_objects():
-    return [
-        StudentTest(),
-        MannUWhitneyTest(),
-        LeveneTest(),
-        BartlettTest(),
-        KolmogorovSmirnovTest(),
-    ]
+    return [_STUDENT, _MUW, _LEVENE, _BARTLETT, _KS]
 
 
 def test_params_type(test_objects):
@@ -30,160 +41,200 @@ def test_params_type(test_objects):
         ), f"{mock_object} is not using the TestParams dataclass"
 
 
-# Central tendancy tests
-def test_student_test_pass():
-    mock_1 = np.random.normal(loc=5, scale=10, size=100)
-    mock_2 = np.random.normal(loc=5.1, scale=10, size=100)
-    res_expected = ttest_ind(mock_1, mock_2)
-    student_res = StudentTest().fit(mock_1, mock_2)
+def test_params_not_shared():
+    mock_1 = 5 + 10 * _NORMAL_POOL[0, 0, :100]
+    mock_2 = 5.1 + 10 * _NORMAL_POOL[0, 1, :100]
+    fitted_res = StudentTest().fit(mock_1, mock_2)
+    unfitted_res = StudentTest()
 
-    assert np.isclose(
-        res_expected[0], student_res.params.test_statistic, atol=0.01
+    assert (
+        fitted_res.params is not unfitted_res.params
+    ), "TestParams instance is shared between tests"
+    assert not unfitted_res.params.is_fitted, "fitting a test modified another one"
+
+
+# Levene's second sample is not drawn from a normal distribution
+_LEVENE_DRAWS = np.stack([_NORMAL_POOL[8, 0], _UNIFORM_POOL])
+
+CASES = [
+    # Central tendancy tests
+    (_STUDENT, ttest_ind, _NORMAL_POOL[1], (5, 10), (5.1, 10), 100, ">", 0.01),
+    (_STUDENT, ttest_ind, _NORMAL_POOL[2], (10, 10), (5.1, 10), 100, "<=", 0.05),
+    (_MUW, mannwhitneyu, _NORMAL_POOL[3], (5, 10), (5.1, 10), 100, ">", 0.05),
+    (_MUW, mannwhitneyu, _NORMAL_POOL[4], (10, 10), (5.1, 10), 100, "<=", 0.01),
+    # Dispersion tests
+    (_BARTLETT, bartlett, _NORMAL_POOL[5], (3, 10), (6, 10), 1000, None, None),
+    (_BARTLETT, bartlett, _NORMAL_POOL[6], (3, 1), (7, 10), 1000, "<=", 0.01),
+    (_LEVENE, levene, _NORMAL_POOL[7], (6, 10), (6, 10), 1000, None, None),
+    (_LEVENE, levene, _LEVENE_DRAWS, (3, 1), (2, 13), 1000, None, None),
+    # Distribution tests
+    (_KS, kstest, _NORMAL_POOL[9], (5, 10), (5.1, 10), 1000, ">", 0.05),
+    (_KS, kstest, _NORMAL_POOL[10], (10, 10), (5.1, 10), 1000, "<=", 0.01),
+]
+CASE_IDS = [
+    "student_pass",
+    "student_does_not_pass",
+    "muw_pass",
+    "muw_does_not_pass",
+    "bartlett_pass",
+    "bartlett_does_not_pass",
+    "levene_pass",
+    "levene_does_not_pass",
+    "ks_pass",
+    "ks_does_not_pass",
+]
+_CASES_BY_ID = dict(zip(CASE_IDS, CASES))
+
+
+@lru_cache(maxsize=None)
+def _samples(case_id: str, dtype: type = np.float32) -> tuple:
+    _, _, draws, law_1, law_2, n, _, _ = _CASES_BY_ID[case_id]
+    draws = draws[:, :n].astype(dtype)
+    mock_1 = law_1[0] + law_1[1] * draws[0]
+    mock_2 = law_2[0] + law_2[1] * draws[1]
+    # the samples are shared between calls
+    mock_1.flags.writeable = mock_2.flags.writeable = False
+    return mock_1, mock_2
+
+
+@lru_cache(maxsize=None)
+def _reference(case_id: str, dtype: type = np.float32) -> tuple:
+    ref = _CASES_BY_ID[case_id][1]
+    return tuple(ref(*_samples(case_id, dtype)))[:2]
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("case_id", CASE_IDS)
+def test_two_sample(case_id, dtype):
+    test, _, _, _, _, _, cmp, thr = _CASES_BY_ID[case_id]
+    test_res = test.fit(*_samples(case_id, dtype))
+
+    ref_statistic, ref_pval = _reference(case_id, dtype)
+    assert _close(
+        ref_statistic, test_res.params.test_statistic, atol=0.01
     ), "tests statistic does not match reference"
-    assert np.isclose(
-        res_expected[1], student_res.params.test_pval, atol=0.01
+    assert _close(
+        ref_pval, test_res.params.test_pval, atol=0.01
     ), "tests pval does not match reference"
-    assert (
-        student_res.params.test_pval > 0.01
-    ), "tests conclusion does not match expectation"
-
-
-def test_student_test_does_not_pass():
-    mock_1 = np.random.normal(loc=10, scale=10, size=100)
-    mock_2 = np.random.normal(loc=5.1, scale=10, size=100)
-    res_expected = ttest_ind(mock_1, mock_2)
-    student_res = StudentTest().fit(mock_1, mock_2)
+    if cmp == ">":
+        assert (
+            test_res.params.test_pval > thr
+        ), "tests conclusion does not match expectation"
+    elif cmp == "<=":
+        assert (
+            test_res.params.test_pval <= thr
+        ), "tests conclusion does not match expectation"
+
+
+@pytest.mark.parametrize(
+    "case_id", ["muw_pass", "muw_does_not_pass", "ks_pass", "ks_does_not_pass"]
+)
+def test_presorted(case_id):
+    mock_1, mock_2 = (np.sort(mock) for mock in _samples(case_id))
+    test_res = _CASES_BY_ID[case_id][0].fit(mock_1, mock_2, presorted=True)
 
-    assert np.isclose(
-        res_expected[0], student_res.params.test_statistic, atol=0.01
+    ref_statistic, ref_pval = _reference(case_id)
+    assert _close(
+        ref_statistic, test_res.params.test_statistic, atol=0.01
     ), "tests statistic does not match reference"
-    assert np.isclose(
-        res_expected[1], student_res.params.test_pval, atol=0.01
-    ), "tests pvalue does not match reference"
-    assert (
-        student_res.params.test_pval <= 0.05
-    ), "tests conclusion does not match expectation"
+    assert _close(
+        ref_pval, test_res.params.test_pval, atol=0.01
+    ), "tests pval does not match reference"
 
 
-def test_muw_test_pass():
-    mock_1 = np.random.normal(loc=5, scale=10, size=100)
-    mock_2 = np.random.normal(loc=5.1, scale=10, size=100)
-    res_expected = mannwhitneyu(mock_1, mock_2)
-    muw_res = MannUWhitneyTest().fit(mock_1, mock_2)
+@pytest.mark.parametrize("test", [_MUW, _KS])
+def test_nan_propagation(test):
+    mock_1 = 5 + 10 * _NORMAL_POOL[0, 0, :200]
+    mock_2 = 5.1 + 10 * _NORMAL_POOL[0, 1, :200]
+    mock_1[17] = np.nan
+    test_res = test.fit(mock_1, mock_2)
 
-    assert np.isclose(
-        res_expected[0], muw_res.params.test_statistic, atol=0.01
-    ), "tests statistic does not match reference"
-    assert np.isclose(
-        res_expected[1], muw_res.params.test_pval, atol=0.01
-    ), "tests pval does not match reference"
-    assert (
-        muw_res.params.test_pval > 0.05
-    ), "tests conclusion does not match expectation"
+    assert np.isnan(test_res.params.test_statistic), "NaN is not propagated"
+    assert np.isnan(test_res.params.test_pval), "NaN is not propagated"
 
 
-def test_muw_test_does_not_pass():
-    mock_1 = np.random.normal(loc=10, scale=10, size=100)
-    mock_2 = np.random.normal(loc=5.1, scale=10, size=100)
-    res_expected = mannwhitneyu(mock_1, mock_2)
-    muw_res = MannUWhitneyTest().fit(mock_1, mock_2)
+def test_ks_test_unequal_large_sizes():
+    mock_1 = 5 + 10 * np.random.default_rng(2).standard_normal(20000)
+    mock_2 = 6 + 10 * _NORMAL_POOL[0, 1, :30]
+    res_expected = kstest(mock_1, mock_2)
+    ks_res = _KS.fit(mock_1, mock_2)
 
-    assert np.isclose(
-        res_expected[0], muw_res.params.test_statistic, atol=0.01
-    ), "tests statistic does not match reference"
-    assert np.isclose(
-        res_expected[1], muw_res.params.test_pval, atol=0.01
+    assert _close(
+        res_expected[1], ks_res.params.test_pval, atol=0.01
     ), "tests pval does not match reference"
-    assert (
-        muw_res.params.test_pval <= 0.01
-    ), "tests conclusion does not match expectation"
 
 
-# Dispersion tests
-def test_bartlett_test_pass():
-    mock_1 = np.random.normal(loc=3, scale=10, size=1000)
-    mock_2 = np.random.normal(loc=6, scale=10, size=1000)
-    res_expected = bartlett(mock_1, mock_2)
-    bartlett_res = BartlettTest().fit(mock_1, mock_2)
+def test_ks_decision_only():
+    mock_1 = 10 + 10 * _NORMAL_POOL[11, 0, :1000]
+    mock_2 = 5.1 + 10 * _NORMAL_POOL[11, 1, :1000]
+    res_expected = kstest(mock_1, mock_2)
+    ks_res = _KS.fit(mock_1, mock_2, decision_only=True)
 
-    assert np.isclose(
-        res_expected[0], bartlett_res.params.test_statistic, atol=0.01
+    assert _close(
+        res_expected[0], ks_res.params.test_statistic, atol=0.01
     ), "tests statistic does not match reference"
-    assert np.isclose(
-        res_expected[1], bartlett_res.params.test_pval, atol=0.01
-    ), "tests pval does not match reference"
+    assert ks_res.params.test_pval is None, "tests pval should not be computed"
+    assert ks_res.params.test_h0_rejected, "tests conclusion does not match expectation"
 
 
-def test_bartlett_test_does_not_pass():
-    mock_1 = np.random.normal(loc=3, scale=1, size=1000)
-    mock_2 = np.random.normal(loc=7, scale=10, size=1000)
-    res_expected = bartlett(mock_1, mock_2)
-    bartlett_res = BartlettTest().fit(mock_1, mock_2)
+def test_ks_decision_only_small_samples():
+    ks_res = _KS.fit([1, 2, 3], [4, 5, 6], decision_only=True)
 
-    assert np.isclose(
-        res_expected[0], bartlett_res.params.test_statistic, atol=0.01
-    ), "tests statistic does not match reference"
-    assert np.isclose(
-        res_expected[1], bartlett_res.params.test_pval, atol=0.01
-    ), "tests pval does not match reference"
     assert (
-        bartlett_res.params.test_pval <= 0.01
+        not ks_res.params.test_h0_rejected
     ), "tests conclusion does not match expectation"
 
 
-def test_levene_test_pass():
-    mock_1 = np.random.normal(loc=6, scale=10, size=1000)
-    mock_2 = np.random.normal(loc=6, scale=10, size=1000)
-    res_expected = levene(mock_1, mock_2, center="median")
-    levene_res = LeveneTest().fit(mock_1, mock_2)
+def test_ks_decision_only_infinite_ties():
+    mock_1 = 5 + 10 * _NORMAL_POOL[11, 0, :200]
+    mock_2 = 5.1 + 10 * _NORMAL_POOL[11, 1, :200]
+    mock_1[:50] = mock_2[:50] = -np.inf
+    res_expected = kstest(mock_1, mock_2)
+    ks_res = _KS.fit(mock_1, mock_2, decision_only=True)
 
-    assert np.isclose(
-        res_expected[0], levene_res.params.test_statistic, atol=200
+    assert _close(
+        res_expected[0], ks_res.params.test_statistic, atol=1e-8
     ), "tests statistic does not match reference"
 
 
-def test_levene_test_does_not_pass():
-    mock_1 = np.random.normal(loc=3, scale=1, size=1000)
-    mock_2 = np.random.uniform(low=2, high=15, size=1000)
-    res_expected = levene(mock_1, mock_2)
-    levene_res = LeveneTest().fit(mock_1, mock_2)
+def test_float32_precision():
+    mock_1 = 5 + 10 * _NORMAL_POOL[12, 0, :1000].astype(np.float64)
+    mock_2 = 5.1 + 10 * _NORMAL_POOL[12, 1, :1000].astype(np.float64)
+    muw_res = MannUWhitneyTest(precision="float32").fit(mock_1, mock_2)
+    ks_res = KolmogorovSmirnovTest(precision="float32").fit(mock_1, mock_2)
 
-    assert np.isclose(
-        res_expected[0], levene_res.params.test_statistic, atol=200
-    ), "tests statistic does not match reference"
-    assert np.isclose(
-        res_expected[1], levene_res.params.test_pval, atol=0.01
-    ), "tests pval does not match reference"
+    for res_expected, test_res in [
+        (mannwhitneyu(mock_1, mock_2), muw_res),
+        (kstest(mock_1, mock_2), ks_res),
+    ]:
+        assert _close(
+            res_expected[1], test_res.params.test_pval, atol=0.01
+        ), "tests pval does not match reference"
 
 
-# Distribution tests
-def test_ks_test_pass():
-    mock_1 = np.random.normal(loc=5, scale=10, size=1000)
-    mock_2 = np.random.normal(loc=5.1, scale=10, size=1000)
-    res_expected = kstest(mock_1, mock_2)
-    ks_res = KolmogorovSmirnovTest().fit(mock_1, mock_2)
+def test_muw_test_ties():
+    mock_1 = np.round(5 + 2 * _NORMAL_POOL[13, 0, :100])
+    mock_2 = np.round(6 + 2 * _NORMAL_POOL[13, 1, :100])
+    res_expected = mannwhitneyu(mock_1, mock_2)
+    muw_res = _MUW.fit(mock_1, mock_2)
 
-    assert np.isclose(
-        res_expected[0], ks_res.params.test_statistic, atol=0.01
+    assert _close(
+        res_expected[0], muw_res.params.test_statistic, atol=0.01
     ), "tests statistic does not match reference"
-    assert np.isclose(
-        res_expected[1], ks_res.params.test_pval, atol=0.01
+    assert _close(
+        res_expected[1], muw_res.params.test_pval, atol=1e-8
     ), "tests pval does not match reference"
-    assert ks_res.params.test_pval > 0.05, "tests conclusion does not match expectation"
 
 
-def test_ks_does_not_pass():
-    mock_1 = np.random.normal(loc=10, scale=10, size=1000)
-    mock_2 = np.random.normal(loc=5.1, scale=10, size=1000)
-    res_expected = kstest(mock_1, mock_2)
-    ks_res = KolmogorovSmirnovTest().fit(mock_1, mock_2)
+def test_muw_test_batch():
+    mock_1 = 5 + 10 * _NORMAL_POOL[14, 0].reshape(100, 10)
+    mock_2 = 7 + 10 * _NORMAL_POOL[14, 1].reshape(100, 10)
+    res_expected = mannwhitneyu(mock_1, mock_2, axis=0)
+    muw_res = _MUW.fit_batch(mock_1, mock_2)
 
-    assert np.isclose(
-        res_expected[0], ks_res.params.test_statistic, atol=0.01
+    assert np.allclose(
+        res_expected[0], muw_res.params.test_statistic, atol=0.01
     ), "tests statistic does not match reference"
-    assert np.isclose(
-        res_expected[1], ks_res.params.test_pval, atol=0.01
+    assert np.allclose(
+        res_expected[1], muw_res.params.test_pval, atol=0.01
     ), "tests pval does not match reference"
-    assert (
-        ks_res.params.test_pval <= 0.01
-    ), "tests conclusion does not match expectation"